@@ -1,9 +1,15 @@
 import os
-import sys
+import time
+import shutil
 import subprocess
 import getpass
 import logging
 import argparse
+from logging.handlers import RotatingFileHandler
+from functools import lru_cache
+from dotenv import load_dotenv
+from rich.text import Text
+from textual import work
 from textual.app import App, ComposeResult
 from textual.widgets import (
     Button,
@@ -19,24 +25,14 @@ from textual.widgets import (
 from textual.containers import Container, Vertical, Horizontal
 from textual.screen import Screen
 from textual.binding import Binding
-from MediaHub.processors.symlink_creator import create_symlinks
-from MediaHub.config.config import get_directories
+from MediaHub.config.config import get_directories as _get_directories
+from MediaHub.config.config import get_known_types, is_browse_all_files_enabled
 
-# Append the parent directory to the system path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-# Local imports from MediaHub
 from MediaHub.utils.logging_utils import log_message
-from MediaHub.processors.db_utils import (
-    get_database_stats,
-    vacuum_database,
-    verify_database_integrity,
-    export_database,
-    import_database,
-    search_database,
-    optimize_database,
-    reset_database,
-)
+
+# MediaHub.processors.db_utils initialises the database on import and
+# MediaHub.processors.symlink_creator pulls it in along with the TMDb
+# processors, so both are imported where they are first needed.
 
 # Script Metadata
 SCRIPT_VERSION = "3.0"
@@ -46,17 +42,100 @@ SCRIPT_DATE = "2025-07-06"
 SCRIPTS_FOLDER = "MediaHub"
 ENV_FILE = ".env"
 
-# Setup logging
-logging.basicConfig(
-    filename="script.log",
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
+# File selection tree label prefixes, indexed by checked state. Labels are
+# built as plain Text so the "[x]" box is not parsed as markup per node.
+DIR_LABELS = ("[📁] [ ] ", "[📁] [x] ")
+FILE_LABELS = ("[📄] [ ] ", "[📄] [x] ")
+
+# Directories list at most this many entries up front; the rest sit behind
+# a "more items" node that loads the next batch when expanded
+MAX_ENTRIES_PER_DIR = 500
+
+# NAS and OS bookkeeping folders that never hold media
+SYSTEM_FOLDERS = frozenset(
+    {"@eaDir", "#recycle", "$RECYCLE.BIN", "System Volume Information"}
 )
 
+# Seconds of typing inactivity before the search is applied
+SEARCH_DEBOUNCE = 0.15
+
+# Database status is reused until something writes to the database or it
+# is older than STATS_TTL seconds (other processes may write to it too)
+STATS_TTL = 5
+_stats_cache = {"epoch": -1, "value": None, "at": 0.0}
+_db_write_epoch = 0
+
 # Determine the Python command based on the OS
 python_command = "python" if os.name == "nt" else "python3"
 
 
+def _configure_logging(verbose=False):
+    """Write DEBUG logs to a rotating script.log with --verbose or CINESYNC_DEBUG."""
+    if not (verbose or os.getenv("CINESYNC_DEBUG")):
+        return
+    handler = RotatingFileHandler(
+        "script.log", maxBytes=1_000_000, backupCount=3, delay=True
+    )
+    handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+    )
+    root_logger = logging.getLogger()
+    root_logger.addHandler(handler)
+    root_logger.setLevel(logging.DEBUG)
+
+
+@lru_cache(maxsize=1)
+def get_directories():
+    """Return (src_dirs, dest_dir), reading the environment only once."""
+    return _get_directories()
+
+
+def reload_env():
+    """Re-read the .env file and drop the cached directories."""
+    load_dotenv(ENV_FILE, override=True)
+    get_directories.cache_clear()
+
+
+def get_browsable_types():
+    """Return the extensions shown in the file browser, or None to show all."""
+    if is_browse_all_files_enabled():
+        return None
+    return get_known_types()
+
+
+def is_browsable(entry, known_types):
+    """Hide dotfiles, system folders and files with unprocessed extensions."""
+    if known_types is None:
+        return True
+    if entry.name.startswith(".") or entry.name in SYSTEM_FOLDERS:
+        return False
+    if entry.is_dir():
+        return True
+    return os.path.splitext(entry.name)[1].lower() in known_types
+
+
+@lru_cache(maxsize=1)
+def find_editor():
+    """Return the absolute path of nano, or None if it is not installed."""
+    return shutil.which("nano")
+
+
+def get_cached_database_stats():
+    """Return database statistics, recomputing them only when stale."""
+    from MediaHub.processors.db_utils import get_database_stats
+
+    now = time.time()
+    if _stats_cache["epoch"] != _db_write_epoch or now - _stats_cache["at"] > STATS_TTL:
+        _stats_cache.update(value=get_database_stats(), epoch=_db_write_epoch, at=now)
+    return _stats_cache["value"]
+
+
+def invalidate_database_stats():
+    """Mark cached database statistics as outdated after a write."""
+    global _db_write_epoch
+    _db_write_epoch += 1
+
+
 class MainMenu(Screen):
     def compose(self) -> ComposeResult:
         yield Header(name="CineSync")
@@ -93,7 +172,18 @@ class MainMenu(Screen):
         if event.button.id == "sort":
             self.app.push_screen(FileSelectionScreen())
         elif event.button.id == "edit_env":
-            self.app.run_subprocess(f"nano {ENV_FILE}")
+            # subprocess only uses posix_spawn for an executable given with a
+            # directory, so resolve nano to its full path first
+            editor = find_editor()
+            if editor is None:
+                self.notify("nano is not installed.", severity="error")
+                return
+            try:
+                with self.app.suspend():
+                    subprocess.run([editor, ENV_FILE], check=True, close_fds=False)
+            except (OSError, subprocess.CalledProcessError) as e:
+                self.notify(f"Could not edit {ENV_FILE}: {e}", severity="error")
+            reload_env()
         elif event.button.id == "db_manage":
             self.app.push_screen(DatabaseMenu())
         elif event.button.id == "exit":
@@ -118,17 +208,25 @@ class DatabaseMenu(Screen):
         )
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
+        from MediaHub.processors.db_utils import (
+            vacuum_database,
+            verify_database_integrity,
+            optimize_database,
+        )
+
         if event.button.id == "db_status":
-            stats = get_database_stats()
+            stats = get_cached_database_stats()
             self.app.push_screen(ResultScreen(Pretty(stats)))
         elif event.button.id == "db_optimize":
             optimize_database()
+            invalidate_database_stats()
             self.app.push_screen(ResultScreen(Static("Database optimized.")))
         elif event.button.id == "db_verify":
             verify_database_integrity()
             self.app.push_screen(ResultScreen(Static("Database integrity verified.")))
         elif event.button.id == "db_vacuum":
             vacuum_database()
+            invalidate_database_stats()
             self.app.push_screen(ResultScreen(Static("Database vacuumed.")))
         elif event.button.id == "db_export":
             # This would need a way to get user input, which is more complex in textual
@@ -151,6 +249,17 @@ class FileSelectionScreen(Screen):
         ("escape", "app.pop_screen", "Back"),
     ]
 
+    def __init__(self):
+        super().__init__()
+        self.selected_paths = set()
+        # Bumped on every tree.clear() so late scan results are dropped
+        self._tree_generation = 0
+        self._search_timer = None
+        self._last_query = ""
+        # path -> (mtime_ns, entries); reused while the directory is unchanged.
+        # Entries are (name, name_lower, path, type) so search never lowercases.
+        self._dir_cache = {}
+
     def compose(self) -> ComposeResult:
         yield Header(name="File Selection")
         yield Footer()
@@ -177,93 +286,184 @@ class FileSelectionScreen(Screen):
         src_dirs, _ = get_directories()
         tree = self.query_one(Tree)
         tree.clear()
-        self.selected_paths = set()
+        self._tree_generation += 1
         # Add only top-level source directories
         for src_dir in src_dirs:
             self._add_full_node(tree.root, src_dir)
         tree.root.expand()
-        self.query_one("#search_apply").on_click = self.on_search_apply
+        self._prefetch_children(src_dirs)
 
-    def _add_full_node(self, parent, path):
-        import os
-
-        basename = os.path.basename(path)
-        node = parent.add(
-            f"[📁] [ ] {basename}",
-            data={"path": path, "type": "dir", "checked": False},
-        )
+    @work(thread=True)
+    def _prefetch_children(self, src_dirs):
+        # Source roots are almost always opened first; read them while the
+        # screen paints so that first expansion does not wait on the disk.
+        for src_dir in src_dirs:
+            self._read_directory(src_dir)
+
+    def _add_full_node(self, parent, path, name=None):
+        # Scanned entries already know their name; only source roots need
+        # it derived from the path. Contents are read on first expansion.
+        if name is None:
+            name = os.path.basename(path.rstrip("/"))
+        return self._add_path_node(parent, name, path, "dir")
+
+    def _add_path_node(self, parent, name, path, node_type):
+        # Selection survives tree rebuilds, so derive the checkbox from it
+        checked = path in self.selected_paths
+        prefixes = DIR_LABELS if node_type == "dir" else FILE_LABELS
+        # Both labels are built once so toggling only swaps references
+        labels = (Text(prefixes[0] + name), Text(prefixes[1] + name))
+        data = {"path": path, "type": node_type, "checked": checked, "labels": labels}
+        if node_type == "dir":
+            # Child directories are only scanned once the user expands them
+            data["loaded"] = False
+            return parent.add(labels[checked], data=data, allow_expand=True)
+        return parent.add_leaf(labels[checked], data=data)
+
+    def _load_children(self, node):
+        node.data["loaded"] = True
+        self._scan_children(node, node.data["path"], self._tree_generation)
+
+    @work(thread=True)
+    def _scan_children(self, node, path, generation):
+        # Directory reads happen off the event loop; only the tree update
+        # is handed back to the UI thread.
+        entries = self._read_directory(path)
+        self.app.call_from_thread(self._fill_node, node, entries, generation)
+
+    def _read_directory(self, path):
+        # A directory's mtime changes whenever an entry is added, removed or
+        # renamed, so an unchanged mtime means the cached listing is current.
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime = None
+        cached = self._dir_cache.get(path)
+        if cached is not None and mtime is not None and cached[0] == mtime:
+            return cached[1]
+        entries = []
+        known_types = get_browsable_types()
         try:
             with os.scandir(path) as it:
                 for entry in it:
+                    if not is_browsable(entry, known_types):
+                        continue
                     if entry.is_dir():
-                        self._add_full_node(node, entry.path)
+                        entries.append(
+                            (entry.name, entry.name.lower(), entry.path, "dir")
+                        )
                     elif entry.is_file():
-                        node.add(
-                            f"[📄] [ ] {entry.name}",
-                            data={"path": entry.path, "type": "file", "checked": False},
+                        entries.append(
+                            (entry.name, entry.name.lower(), entry.path, "file")
                         )
-        except Exception as e:
-            print(f"EXCEPTION in _add_full_node: {e}")
+        except OSError as e:
+            log_message(f"Could not read directory {path}: {e}", level="WARNING")
+        # Folders first, then files, each alphabetically
+        entries.sort(key=lambda e: (e[3] != "dir", e[1]))
+        if mtime is not None:
+            self._dir_cache[path] = (mtime, entries)
+        return entries
+
+    def _fill_node(self, node, entries, generation, offset=0):
+        if generation != self._tree_generation:
+            return
+        end = offset + MAX_ENTRIES_PER_DIR
+        with self.app.batch_update():
+            for name, _, path, node_type in entries[offset:end]:
+                self._add_path_node(node, name, path, node_type)
+            remaining = len(entries) - end
+            if remaining > 0:
+                node.add(
+                    Text(f"[…] {remaining} more items"),
+                    data={"type": "more", "entries": entries, "offset": end},
+                    allow_expand=True,
+                )
+
+    def on_tree_node_expanded(self, event):
+        node = event.node
+        data = node.data
+        if not data:
+            return
+        if data.get("type") == "dir" and not data.get("loaded"):
+            node.remove_children()
+            self._load_children(node)
+        elif data.get("type") == "more":
+            parent = node.parent
+            node.remove()
+            self._fill_node(
+                parent, data["entries"], self._tree_generation, data["offset"]
+            )
 
     def on_tree_node_selected(self, event):
         node = event.node
         data = node.data
-        if data:
+        if data and data["type"] in ("dir", "file"):
             checked = not data.get("checked", False)
             data["checked"] = checked
-            label_str = str(node.label)
+            node.set_label(data["labels"][checked])
             if checked:
-                node.set_label(label_str.replace("[ ]", "[x]", 1))
                 self.selected_paths.add(data["path"])
             else:
-                node.set_label(label_str.replace("[x]", "[ ]", 1))
                 self.selected_paths.discard(data["path"])
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "sort_selected":
             if self.selected_paths:
                 self.app.push_screen(LogScreen(list(self.selected_paths)))
-
-    def on_search_apply(self, event):
+        elif event.button.id == "search_apply":
+            self._apply_search()
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        # Coalesce fast typing into a single rebuild
+        if event.input.id == "search_bar":
+            if self._search_timer is not None:
+                self._search_timer.stop()
+            self._search_timer = self.set_timer(SEARCH_DEBOUNCE, self._apply_search)
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        if event.input.id == "search_bar":
+            self._apply_search()
+
+    def _apply_search(self):
+        if self._search_timer is not None:
+            self._search_timer.stop()
+            self._search_timer = None
         value = self.query_one("#search_bar").value.strip()
-        self._rebuild_tree_with_search(value)
+        if value == self._last_query:
+            return
+        self._last_query = value
+        # One repaint for the whole rebuild instead of one per added node
+        with self.app.batch_update():
+            self._rebuild_tree_with_search(value)
 
     def _rebuild_tree_with_search(self, query):
         # Rebuild the tree, only showing matching nodes (and their parents)
         src_dirs, _ = get_directories()
         tree = self.query_one(Tree)
         tree.clear()
+        self._tree_generation += 1
         if not query:
             for src_dir in src_dirs:
                 self._add_full_node(tree.root, src_dir)
             tree.root.expand()
             return
         # If query, do a shallow search (top-level only, for performance)
+        q = query.lower()
         for src_dir in src_dirs:
-            import os
-
             basename = os.path.basename(src_dir.rstrip("/"))
-            if query.lower() in basename.lower():
+            if q in basename.lower():
                 self._add_full_node(tree.root, src_dir)
             else:
-                # Search immediate children
-                try:
-                    for name in sorted(os.listdir(src_dir)):
-                        if query.lower() in name.lower():
-                            full_path = os.path.join(src_dir, name)
-                            if os.path.isdir(full_path):
-                                self._add_full_node(tree.root, full_path)
-                            else:
-                                tree.root.add(
-                                    f"[📄] [ ] {name}",
-                                    data={
-                                        "path": full_path,
-                                        "type": "file",
-                                        "checked": False,
-                                    },
-                                )
-                except Exception:
-                    pass
+                # Search immediate children. The listing is the same mtime-checked,
+                # already sorted one that expanding the source root uses, and
+                # carries each name lowercased so keystrokes only do substring checks.
+                for name, name_lower, path, node_type in self._read_directory(src_dir):
+                    if q not in name_lower:
+                        continue
+                    if node_type == "dir":
+                        self._add_full_node(tree.root, path, name)
+                    else:
+                        self._add_path_node(tree.root, name, path, "file")
         tree.root.expand()
 
 
@@ -284,23 +484,32 @@ class LogScreen(Screen):
     def on_mount(self) -> None:
         self.run_sorting()
 
+    @work(thread=True, exclusive=True)
     def run_sorting(self):
+        # Runs in a worker thread so the log view and Back button stay live;
+        # widget writes are marshalled back to the UI thread.
+        from MediaHub.processors.symlink_creator import create_symlinks
+
         log_view = self.query_one(RichLog)
         _, dest_dir = get_directories()
 
+        def write(text):
+            self.app.call_from_thread(log_view.write, text)
+
         def log_to_widget(message, level="INFO"):
             if level == "INFO":
-                log_view.write(f"[green]INFO[/green]: {message}")
+                write(f"[green]INFO[/green]: {message}")
             elif level == "WARNING":
-                log_view.write(f"[yellow]WARNING[/yellow]: {message}")
+                write(f"[yellow]WARNING[/yellow]: {message}")
             elif level == "ERROR":
-                log_view.write(f"[red]ERROR[/red]: {message}")
+                write(f"[red]ERROR[/red]: {message}")
             else:
-                log_view.write(f"[white]{level}[/white]: {message}")
+                write(f"[white]{level}[/white]: {message}")
 
         create_symlinks(
             self.paths_to_sort, dest_dir, auto_select=True, console_log=log_to_widget
         )
+        invalidate_database_stats()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "back":
@@ -308,6 +517,10 @@ class LogScreen(Screen):
 
 
 class ResultScreen(Screen):
+    BINDINGS = [
+        ("escape", "app.pop_screen", "Back"),
+    ]
+
     def __init__(self, content):
         super().__init__()
         self.content = content
@@ -342,15 +555,20 @@ def main():
     parser.add_argument(
         "--sort-all", action="store_true", help="Sort all files without prompting"
     )
+    parser.add_argument(
+        "--verbose", action="store_true", help="Write debug logs to script.log"
+    )
     args = parser.parse_args()
+    _configure_logging(args.verbose)
 
     if args.sort_all:
+        from MediaHub.processors.symlink_creator import create_symlinks
+
         src_dirs, dest_dir = get_directories()
         if not src_dirs:
             print("[bold red]Error: SOURCE_DIR not set in .env file.[/bold red]")
             return
-        for src_dir in src_dirs:
-            create_symlinks([src_dir], dest_dir, auto_select=True)
+        create_symlinks(src_dirs, dest_dir, auto_select=True)
         print("[bold green]Sorting complete![/bold green]")
         return
 
@@ -338,9 +338,7 @@ def perform_search(params, url):
         query = re.sub(r'\band\b', '&', query)
         params['query'] = query
 
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        results = response.json().get('results', [])
+        results = fetch_tmdb_json(url, params).get('results', [])
 
         if not results:
             return []
@@ -6,6 +6,8 @@ import urllib.parse
 import logging
 import unicodedata
 import difflib
+import threading
+from collections import OrderedDict
 from bs4 import BeautifulSoup
 from functools import lru_cache
 from MediaHub.utils.logging_utils import log_message
@@ -17,19 +19,66 @@ _api_cache = {}
 # Global variables for API key status and warnings
 api_key = get_api_key()
 api_warning_logged = False
+api_key_valid = False
+
+# TMDb responses reused within one create_symlinks run, see fetch_tmdb_json.
+# Least recently used entries are dropped beyond RESPONSE_CACHE_SIZE so that
+# titles looked up only once do not pile up over a long run.
+RESPONSE_CACHE_SIZE = 1024
+_response_cache = OrderedDict()
+_response_cache_lock = threading.Lock()
 
 # Disable urllib3 debug logging
 logging.getLogger("urllib3").setLevel(logging.WARNING)
 
+def fetch_tmdb_json(url, params):
+    """
+    GET a TMDb endpoint and return the decoded JSON, remembering successful
+    responses until clear_tmdb_cache() is called at the start of the next run,
+    keeping at most RESPONSE_CACHE_SIZE of the most recently used ones.
+    Episodes of one show repeat the same search and show lookups, so they only
+    hit the API once per run. Errors and empty search results are not cached,
+    so a title TMDb does not list yet is looked up again for the next file.
+    The returned object is shared between callers and must not be modified.
+    """
+    key = (url, tuple(sorted(params.items())))
+    with _response_cache_lock:
+        cached = _response_cache.get(key)
+        if cached is not None:
+            _response_cache.move_to_end(key)
+    if cached is not None:
+        return cached
+
+    response = requests.get(url, params=params)
+    response.raise_for_status()
+    data = response.json()
+    if not (isinstance(data, dict) and data.get('results') == []):
+        with _response_cache_lock:
+            _response_cache[key] = data
+            _response_cache.move_to_end(key)
+            if len(_response_cache) > RESPONSE_CACHE_SIZE:
+                _response_cache.popitem(last=False)
+    return data
+
+def clear_tmdb_cache():
+    """Forget cached TMDb responses and the API key check; called once per run."""
+    global api_key_valid
+    with _response_cache_lock:
+        _response_cache.clear()
+    api_key_valid = False
+
 def check_api_key():
-    global api_key, api_warning_logged
+    global api_key, api_warning_logged, api_key_valid
     if not api_key:
         return False
+    if api_key_valid:
+        return True
     url = "https://api.themoviedb.org/3/configuration"
     params = {'api_key': api_key}
     try:
         response = requests.get(url, params=params)
         response.raise_for_status()
+        api_key_valid = True
         return True
     except requests.exceptions.RequestException as e:
         if not api_warning_logged:
@@ -42,9 +91,7 @@ def get_external_ids(item_id, media_type):
     params = {'api_key': api_key}
 
     try:
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
+        return fetch_tmdb_json(url, params)
     except requests.exceptions.RequestException as e:
         log_message(f"Error fetching external IDs: {e}", level="ERROR")
         return {}
@@ -66,17 +113,13 @@ def get_movie_genres(movie_id):
     params = {'api_key': api_key}
 
     try:
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        movie_details = response.json()
+        movie_details = fetch_tmdb_json(url, params)
 
         genres = [genre['name'] for genre in movie_details.get('genres', [])]
         language = movie_details.get('original_language', '')
 
         keywords_url = f"https://api.themoviedb.org/3/movie/{movie_id}/keywords"
-        keywords_response = requests.get(keywords_url, params=params)
-        keywords_response.raise_for_status()
-        keywords = [kw['name'].lower() for kw in keywords_response.json().get('keywords', [])]
+        keywords = [kw['name'].lower() for kw in fetch_tmdb_json(keywords_url, params).get('keywords', [])]
 
         is_anime = any([
             'anime' in movie_details.get('title', '').lower(),
@@ -113,18 +156,14 @@ def get_show_genres(show_id):
 
     try:
         # Get show details including genres
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        show_details = response.json()
+        show_details = fetch_tmdb_json(url, params)
 
         genres = [genre['name'] for genre in show_details.get('genres', [])]
         language = show_details.get('original_language', '')
 
         # Get keywords for the show
         keywords_url = f"https://api.themoviedb.org/3/tv/{show_id}/keywords"
-        keywords_response = requests.get(keywords_url, params=params)
-        keywords_response.raise_for_status()
-        keywords = [kw['name'].lower() for kw in keywords_response.json().get('results', [])]
+        keywords = [kw['name'].lower() for kw in fetch_tmdb_json(keywords_url, params).get('results', [])]
 
         # Check if it's an anime based on multiple criteria
         is_anime = any([
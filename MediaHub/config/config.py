@@ -79,6 +79,11 @@ def is_skip_extras_folder_enabled():
 def get_junk_max_size_mb():
      return int(os.getenv('JUNK_MAX_SIZE_MB', '5'))
 
+def get_max_workers():
+    """Number of threads used to process files; the work is mostly waiting on disk and TMDB"""
+    default = min(32, (os.cpu_count() or 1) * 4)
+    return max(1, int(os.getenv('CINESYNC_WORKERS', default)))
+
 def is_source_structure_enabled():
     return os.getenv('USE_SOURCE_STRUCTURE', 'false').lower() == 'true'
 
@@ -148,6 +153,10 @@ def get_known_types(filename=None):
         return ext in known_types
     return known_types
 
+def is_browse_all_files_enabled():
+    """Check if the file browser should list every file, not just allowed extensions"""
+    return os.getenv('BROWSE_ALL_FILES', 'false').lower() == 'true'
+
 def is_show_resolution_structure_enabled():
     """Check if resolution structure is enabled in configuration"""
     return os.getenv('SHOW_RESOLUTION_STRUCTURE', 'false').lower() == 'true'
@@ -11,6 +11,7 @@ from sqlite3 import DatabaseError
 from functools import wraps
 from dotenv import load_dotenv, find_dotenv
 from MediaHub.utils.logging_utils import log_message
+from MediaHub.utils.batch_utils import BatchQueue
 
 # Load environment variables
 dotenv_path = find_dotenv('../.env')
@@ -33,6 +34,10 @@ RETRY_DELAY = float(os.getenv('DB_RETRY_DELAY', 1.0))
 BATCH_SIZE = int(os.getenv('DB_BATCH_SIZE', 1000))
 MAX_WORKERS = int(os.getenv('DB_MAX_WORKERS', 4))
 
+# Batching for ProcessedFilesWriter
+WRITE_BATCH_SIZE = 500
+WRITE_FLUSH_INTERVAL = 0.25
+
 class DatabaseError(Exception):
     pass
 
@@ -234,6 +239,44 @@ def save_processed_file(conn, source_path, dest_path, tmdb_id=None, season_numbe
         log_message(f"Error in save_processed_file: {e}", level="ERROR")
         conn.rollback()
 
+@throttle
+@retry_on_db_lock
+@with_connection(main_pool)
+def save_processed_files_batch(conn, records):
+    """Save many (source_path, dest_path, tmdb_id, season_number) rows in one transaction."""
+    rows = [
+        (normalize_file_path(source_path), normalize_file_path(dest_path), tmdb_id, season_number)
+        for source_path, dest_path, tmdb_id, season_number in records
+    ]
+    try:
+        cursor = conn.cursor()
+        cursor.executemany("""
+            INSERT OR REPLACE INTO processed_files (file_path, destination_path, tmdb_id, season_number)
+            VALUES (?, ?, ?, ?)
+        """, rows)
+        conn.commit()
+    except (sqlite3.Error, DatabaseError) as e:
+        log_message(f"Error in save_processed_files_batch: {e}", level="ERROR")
+        conn.rollback()
+
+class ProcessedFilesWriter(BatchQueue):
+    """
+    Queue save_processed_file calls from worker threads and write them from a
+    single thread, committing up to WRITE_BATCH_SIZE rows at a time or whatever
+    arrived within WRITE_FLUSH_INTERVAL seconds.
+    """
+    def __init__(self, batch_size=WRITE_BATCH_SIZE, flush_interval=WRITE_FLUSH_INTERVAL):
+        super().__init__(flush_interval, batch_size=batch_size)
+
+    def save(self, source_path, dest_path, tmdb_id=None, season_number=None):
+        self.put((source_path, dest_path, tmdb_id, season_number))
+
+    def handle_batch(self, batch):
+        try:
+            save_processed_files_batch(batch)
+        except DatabaseError as e:
+            log_message(f"Failed to save {len(batch)} processed files: {e}", level="ERROR")
+
 @throttle
 @retry_on_db_lock
 @with_connection(main_pool)
@@ -56,10 +56,27 @@ def update_file_index(dest_dir):
         conn.commit()
 
 def get_dest_index_from_db():
+    """Map symlink targets to symlink paths, like build_dest_index."""
     with sqlite3.connect(PROCESS_DB) as conn:
         cursor = conn.cursor()
-        cursor.execute('SELECT path FROM file_index')
-        return [row[0] for row in cursor.fetchall()]
+        cursor.execute('SELECT path, target_path FROM file_index WHERE is_symlink AND target_path IS NOT NULL')
+        return {os.path.normpath(target): path for path, target in cursor.fetchall()}
+
+def save_dest_index(dest_index):
+    """Store a {target: symlink path} index, as built by build_dest_index, in file_index."""
+    rows = []
+    for target_path, path in dest_index.items():
+        try:
+            rows.append((path, True, target_path, os.lstat(path).st_mtime))
+        except OSError:
+            continue
+    with sqlite3.connect(PROCESS_DB) as conn:
+        cursor = conn.cursor()
+        cursor.executemany('''
+            INSERT OR REPLACE INTO file_index (path, is_symlink, target_path, last_modified)
+            VALUES (?, ?, ?, ?)
+        ''', rows)
+        conn.commit()
 
 def update_single_file_index(dest_file, is_symlink, target_path):
     """Update a single file entry in the database."""
@@ -3,16 +3,22 @@ import platform
 import re
 import time
 import traceback
+from functools import partial
 import sqlite3
 from threading import Thread
 from queue import Queue, Empty
 from threading import Thread, Event
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from multiprocessing import cpu_count
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 from threading import Event
 from MediaHub.processors.movie_processor import process_movie
 from MediaHub.processors.show_processor import process_show
-from MediaHub.utils.logging_utils import log_message
+from MediaHub.api.tmdb_api_helpers import clear_tmdb_cache
+from MediaHub.utils.logging_utils import is_log_level_enabled, log_message
 from MediaHub.utils.file_utils import build_dest_index, get_anime_patterns, is_junk_file
 from MediaHub.monitor.symlink_cleanup import run_symlink_cleanup
 from MediaHub.config.config import *
@@ -24,8 +30,48 @@ error_event = Event()
 log_imported_db = False
 db_initialized = False
 
-
-def process_file(args, processed_files_log, force=False, console=None):
+# Filename patterns used by process_file, compiled once per process
+_HASH_RE = re.compile(r"^[a-f0-9]{32}(\.[^.]+$|\[.+?\]\.)", re.IGNORECASE)
+_EPISODE_RE = re.compile(
+    r"(.*?)(S\d{1,2}\.?E\d{2}|S\d{1,2}\s*\d{2}|S\d{2}E\d{2}|S\d{2}e\d{2}|(?<!\d{3})\b[1-9][0-9]?x[0-9]{1,2}\b(?!\d{3})|[0-9]+e[0-9]+|\bep\.?\s*\d{1,2}\b|\bEp\.?\s*\d{1,2}\b|\bEP\.?\s*\d{1,2}\b|S\d{2}\sE\d{2}|MINI[- ]SERIES|MINISERIES|\s-\s(?!1080p|720p|480p|2160p|\d+Kbps|\d{4}|\d+bit)\d{2,3}(?!Kbps)|\s-(?!1080p|720p|480p|2160p|\d+Kbps|\d{4}|\d+bit)\d{2,3}(?!Kbps)|\s-\s*(?!1080p|720p|480p|2160p|\d+Kbps|\d{4}|\d+bit)\d{2,3}(?!Kbps)|[Ee]pisode\s*\d{2}|[Ee]p\s*\d{2}|Season_-\d{2}|\bSeason\d+\b|\bE\d+\b|series\.\d+\.\d+of\d+|Episode\s+(\d+)\s+(.*?)\.(\w+)|\b\d{2}x\d{2}\b)",
+    re.IGNORECASE,
+)
+_MINI_SERIES_RE = re.compile(r"(MINI[- ]SERIES|MINISERIES)", re.IGNORECASE)
+# Every _EPISODE_RE alternative needs a digit except the mini-series ones, so
+# names without either can skip both patterns above
+_EPISODE_HINT_RE = re.compile(r"\d|mini", re.IGNORECASE)
+_ANIME_EP_RE = re.compile(r"\s-\s\d{2,3}\s|\d{2,3}v\d+", re.IGNORECASE)
+_SEASON_RE = re.compile(r"\b(s\d{2})\b", re.IGNORECASE)
+_ANIME_PATTERNS = get_anime_patterns()
+
+# Skip formatting DEBUG-only messages in process_file when they would be dropped
+_DEBUG_LOGGING = is_log_level_enabled("DEBUG")
+
+
+def is_empty_dir(path):
+    """Check for an empty directory without listing all of its entries."""
+    with os.scandir(path) as it:
+        return next(it, None) is None
+
+
+def process_file(
+    args,
+    processed_files_log,
+    force,
+    console,
+    *,
+    skip_extras_folder,
+    plex_enabled,
+    save_file,
+    known_types,
+    update_plex,
+    entry=None,
+):
+    """
+    Process one source file. Called through the partial built by
+    create_symlinks, which resolves the per-run settings and normalizes the
+    source paths that end up in args.
+    """
     (
         src_file,
         root,
@@ -49,19 +95,14 @@ def process_file(args, processed_files_log, force=False, console=None):
     if error_event.is_set():
         return
 
-    # Normalize path
-    src_file = os.path.normpath(src_file)
-
     # Skip if not a known file type
-    if not get_known_types(file):
+    if os.path.splitext(file.lower())[1] not in known_types:
         if console:
             console(f"Skipping unsupported file type: {file}")
         else:
             log_message(f"Skipping unsupported file type: {file}", level="INFO")
         return
 
-    skip_extras_folder = is_skip_extras_folder_enabled()
-
     # Handle force mode
     if force:
         existing_symlink_path = get_existing_symlink_info(src_file)
@@ -70,7 +111,7 @@ def process_file(args, processed_files_log, force=False, console=None):
                 console(
                     f"Force mode: Found existing symlink at {existing_symlink_path}"
                 )
-            else:
+            elif _DEBUG_LOGGING:
                 log_message(
                     f"Force mode: Found existing symlink at {existing_symlink_path}",
                     level="DEBUG",
@@ -87,7 +128,7 @@ def process_file(args, processed_files_log, force=False, console=None):
 
             # Delete if parent directory is empty
             try:
-                if not os.listdir(parent_dir):
+                if is_empty_dir(parent_dir):
                     if console:
                         console(f"Deleting empty directory: {parent_dir}")
                     else:
@@ -96,7 +137,7 @@ def process_file(args, processed_files_log, force=False, console=None):
                         )
                     os.rmdir(parent_dir)
 
-                    if not os.listdir(parent_parent_dir):
+                    if is_empty_dir(parent_parent_dir):
                         if console:
                             console(f"Deleting empty directory: {parent_parent_dir}")
                         else:
@@ -115,24 +156,35 @@ def process_file(args, processed_files_log, force=False, console=None):
     if existing_dest_path and not force:
         if not os.path.exists(existing_dest_path):
             dir_path = os.path.dirname(existing_dest_path)
-            if os.path.exists(dir_path):
-                for filename in os.listdir(dir_path):
-                    potential_new_path = os.path.join(dir_path, filename)
-                    if (
-                        os.path.islink(potential_new_path)
-                        and os.readlink(potential_new_path) == src_file
-                    ):
-                        if console:
-                            console(
-                                f"Detected renamed file: {existing_dest_path} -> {potential_new_path}"
-                            )
-                        else:
-                            log_message(
-                                f"Detected renamed file: {existing_dest_path} -> {potential_new_path}",
-                                level="INFO",
-                            )
-                        update_renamed_file(existing_dest_path, potential_new_path)
-                        return
+            # Look for a sibling symlink that still points at this source.
+            # DirEntry.is_symlink() uses the type from the directory read, so
+            # only real symlinks cost a readlink call.
+            potential_new_path = None
+            try:
+                with os.scandir(dir_path) as it:
+                    potential_new_path = next(
+                        (
+                            entry.path
+                            for entry in it
+                            if entry.is_symlink()
+                            and os.readlink(entry.path) == src_file
+                        ),
+                        None,
+                    )
+            except OSError:
+                pass
+            if potential_new_path:
+                if console:
+                    console(
+                        f"Detected renamed file: {existing_dest_path} -> {potential_new_path}"
+                    )
+                else:
+                    log_message(
+                        f"Detected renamed file: {existing_dest_path} -> {potential_new_path}",
+                        level="INFO",
+                    )
+                update_renamed_file(existing_dest_path, potential_new_path)
+                return
 
             if console:
                 console(f"Destination file missing. Re-processing: {src_file}")
@@ -152,25 +204,17 @@ def process_file(args, processed_files_log, force=False, console=None):
                 )
             return
 
-    # Check if a symlink already exists
-    existing_symlink = next(
-        (
-            full_dest_file
-            for full_dest_file in dest_index
-            if os.path.islink(full_dest_file)
-            and os.readlink(full_dest_file) == src_file
-        ),
-        None,
-    )
+    # Check if a symlink already exists; the index maps targets to symlinks
+    existing_symlink = dest_index.get(src_file)
+    if existing_symlink and not os.path.islink(existing_symlink):
+        existing_symlink = None
 
     if existing_symlink and not force:
         if console:
-            console(f"Symlink already exists for {os.path.basename(file)}")
+            console(f"Symlink already exists for {file}")
         else:
-            log_message(
-                f"Symlink already exists for {os.path.basename(file)}", level="INFO"
-            )
-        save_processed_file(src_file, existing_symlink, tmdb_id)
+            log_message(f"Symlink already exists for {file}", level="INFO")
+        save_file(src_file, existing_symlink, tmdb_id)
         return
 
     # Show detection logic
@@ -179,8 +223,7 @@ def process_file(args, processed_files_log, force=False, console=None):
     episode_match = None
 
     # Skip hash filenames unless they have valid media patterns
-    hash_pattern = re.compile(r"^[a-f0-9]{32}(\.[^.]+$|\[.+?\]\.)", re.IGNORECASE)
-    is_hash_name = hash_pattern.search(file) is not None
+    is_hash_name = _HASH_RE.search(file) is not None
 
     if is_hash_name and not tmdb_id and not imdb_id:
         if console:
@@ -209,24 +252,18 @@ def process_file(args, processed_files_log, force=False, console=None):
                 f"Processing as movie based on Force Movie flag: {file}", level="INFO"
             )
     else:
-        episode_match = re.search(
-            r"(.*?)(S\d{1,2}\.?E\d{2}|S\d{1,2}\s*\d{2}|S\d{2}E\d{2}|S\d{2}e\d{2}|(?<!\d{3})\b[1-9][0-9]?x[0-9]{1,2}\b(?!\d{3})|[0-9]+e[0-9]+|\bep\.?\s*\d{1,2}\b|\bEp\.?\s*\d{1,2}\b|\bEP\.?\s*\d{1,2}\b|S\d{2}\sE\d{2}|MINI[- ]SERIES|MINISERIES|\s-\s(?!1080p|720p|480p|2160p|\d+Kbps|\d{4}|\d+bit)\d{2,3}(?!Kbps)|\s-(?!1080p|720p|480p|2160p|\d+Kbps|\d{4}|\d+bit)\d{2,3}(?!Kbps)|\s-\s*(?!1080p|720p|480p|2160p|\d+Kbps|\d{4}|\d+bit)\d{2,3}(?!Kbps)|[Ee]pisode\s*\d{2}|[Ee]p\s*\d{2}|Season_-\d{2}|\bSeason\d+\b|\bE\d+\b|series\.\d+\.\d+of\d+|Episode\s+(\d+)\s+(.*?)\.(\w+)|\b\d{2}x\d{2}\b)",
-            file,
-            re.IGNORECASE,
-        )
-        mini_series_match = re.search(
-            r"(MINI[- ]SERIES|MINISERIES)", file, re.IGNORECASE
-        )
-        anime_episode_pattern = re.compile(r"\s-\s\d{2,3}\s|\d{2,3}v\d+", re.IGNORECASE)
-        anime_patterns = get_anime_patterns()
-        season_pattern = re.compile(r"\b(s\d{2})\b", re.IGNORECASE)
+        if _EPISODE_HINT_RE.search(file):
+            episode_match = _EPISODE_RE.search(file)
+            mini_series_match = _MINI_SERIES_RE.search(file)
+        else:
+            mini_series_match = None
 
         # Check file path and name for show patterns
-        if season_pattern.search(src_file):
+        if _SEASON_RE.search(src_file):
             is_show = True
             if console:
                 console(f"Processing as show based on directory structure: {src_file}")
-            else:
+            elif _DEBUG_LOGGING:
                 log_message(
                     f"Processing as show based on directory structure: {src_file}",
                     level="DEBUG",
@@ -235,26 +272,26 @@ def process_file(args, processed_files_log, force=False, console=None):
             is_show = True
             if console:
                 console(f"Processing as show based on file pattern: {src_file}")
-            else:
+            elif _DEBUG_LOGGING:
                 log_message(
                     f"Processing as show based on file pattern: {src_file}",
                     level="DEBUG",
                 )
-        elif anime_episode_pattern.search(file) or anime_patterns.search(file):
+        elif _ANIME_EP_RE.search(file) or _ANIME_PATTERNS.search(file):
             is_anime_show = True
             if console:
                 console(f"Processing as show based on anime pattern: {src_file}")
-            else:
+            elif _DEBUG_LOGGING:
                 log_message(
                     f"Processing as show based on anime pattern: {src_file}",
                     level="DEBUG",
                 )
 
     # Check if the file should be considered an junk based on size
-    if is_junk_file(file, src_file):
+    if is_junk_file(file, src_file, entry=entry):
         if console:
             console(f"Skipping Junk files: {file} based on size")
-        else:
+        elif _DEBUG_LOGGING:
             log_message(f"Skipping Junk files: {file} based on size", level="DEBUG")
         return
 
@@ -281,7 +318,7 @@ def process_file(args, processed_files_log, force=False, console=None):
         )
 
         # Skip symlink creation for extras unless skipped from env or force_extra is enabled
-        if is_extra and not force_extra and is_skip_extras_folder_enabled():
+        if is_extra and not force_extra and skip_extras_folder:
             if console:
                 console(f"Skipping symlink creation for extra file: {file}")
             else:
@@ -313,24 +350,41 @@ def process_file(args, processed_files_log, force=False, console=None):
             )
         return
 
-    os.makedirs(os.path.dirname(dest_file), exist_ok=True)
+    # Create symlink. Most destinations are new, so try that first and only
+    # inspect the path when the directory is missing or the name is taken.
+    try:
+        try:
+            os.symlink(src_file, dest_file)
+        except FileNotFoundError:
+            os.makedirs(os.path.dirname(dest_file), exist_ok=True)
+            os.symlink(src_file, dest_file)
+        except FileExistsError:
+            if not os.path.islink(dest_file):
+                if console:
+                    console(
+                        f"File already exists at destination: {os.path.basename(dest_file)}"
+                    )
+                else:
+                    log_message(
+                        f"File already exists at destination: {os.path.basename(dest_file)}",
+                        level="INFO",
+                    )
+                return
+
+            existing_src = os.readlink(dest_file)
+            if existing_src == src_file:
+                if console:
+                    console(
+                        f"Symlink already exists and is correct: {dest_file} -> {src_file}"
+                    )
+                else:
+                    log_message(
+                        f"Symlink already exists and is correct: {dest_file} -> {src_file}",
+                        level="INFO",
+                    )
+                save_file(src_file, dest_file, tmdb_id)
+                return
 
-    # Check if symlink already exists
-    if os.path.islink(dest_file):
-        existing_src = os.readlink(dest_file)
-        if existing_src == src_file:
-            if console:
-                console(
-                    f"Symlink already exists and is correct: {dest_file} -> {src_file}"
-                )
-            else:
-                log_message(
-                    f"Symlink already exists and is correct: {dest_file} -> {src_file}",
-                    level="INFO",
-                )
-            save_processed_file(src_file, dest_file, tmdb_id)
-            return
-        else:
             if console:
                 console(
                     f"Updating existing symlink: {dest_file} -> {src_file} (was: {existing_src})"
@@ -341,30 +395,17 @@ def process_file(args, processed_files_log, force=False, console=None):
                     level="INFO",
                 )
             os.remove(dest_file)
+            os.symlink(src_file, dest_file)
 
-    if os.path.exists(dest_file) and not os.path.islink(dest_file):
-        if console:
-            console(
-                f"File already exists at destination: {os.path.basename(dest_file)}"
-            )
-        else:
-            log_message(
-                f"File already exists at destination: {os.path.basename(dest_file)}",
-                level="INFO",
-            )
-        return
-
-    # Create symlink
-    try:
-        os.symlink(src_file, dest_file)
+        dest_index[src_file] = dest_file
         if console:
             console(f"Created symlink: {dest_file} -> {src_file}")
         else:
             log_message(f"Created symlink: {dest_file} -> {src_file}", level="INFO")
-        save_processed_file(src_file, dest_file, tmdb_id, season_number)
+        save_file(src_file, dest_file, tmdb_id, season_number)
 
-        if plex_update() and plex_token():
-            update_plex_after_symlink(dest_file)
+        if plex_enabled:
+            update_plex(dest_file)
 
         return (dest_file, True, src_file)
 
@@ -391,6 +432,46 @@ def process_file(args, processed_files_log, force=False, console=None):
     return None
 
 
+def iter_media_dirs(base_dir):
+    """
+    Walk base_dir like os.walk, yielding (root, entries) with the DirEntry of
+    each file that has a known extension. Uses os.scandir directly so the entry
+    types come from the directory read, and the entries are handed on to
+    process_file so later checks can reuse them instead of calling stat again.
+    """
+    known_types = get_known_types()
+    stack = [base_dir]
+    while stack:
+        root = stack.pop()
+        try:
+            with os.scandir(root) as it:
+                entries = list(it)
+        except OSError as e:
+            log_message(f"Error scanning directory {root}: {e}", level="WARNING")
+            continue
+
+        files = []
+        for entry in entries:
+            if entry.is_dir():
+                # Like os.walk, list symlinked directories but do not descend
+                if not entry.is_symlink():
+                    stack.append(entry.path)
+            elif os.path.splitext(entry.name.lower())[1] in known_types:
+                files.append(entry)
+        yield root, files
+
+
+def collect_media_files(src_dir):
+    """
+    Return the (root, entries) groups to process for one normalized source
+    path, as create_symlinks passes it. A single file source is only counted,
+    so its group holds the file name.
+    """
+    if os.path.isfile(src_dir):
+        return [(os.path.dirname(src_dir), [os.path.basename(src_dir)])]
+    return list(iter_media_dirs(src_dir))
+
+
 def create_symlinks(
     src_dirs,
     dest_dir,
@@ -411,10 +492,26 @@ def create_symlinks(
     global log_imported_db
 
     os.makedirs(dest_dir, exist_ok=True)
+    # TMDb responses are only shared between the files of one run
+    clear_tmdb_cache()
     tmdb_folder_id_enabled = is_tmdb_folder_id_enabled()
     rename_enabled = is_rename_enabled()
     skip_extras_folder = is_skip_extras_folder_enabled()
     imdb_structure_id_enabled = is_imdb_folder_id_enabled()
+    plex_enabled = bool(plex_update() and plex_token())
+
+    # Processed-file records are queued and committed in batches by one thread,
+    # and Plex refreshes are grouped by folder on another
+    writer = ProcessedFilesWriter()
+    plex_updates = PlexUpdateQueue()
+    run_file = partial(
+        process_file,
+        skip_extras_folder=skip_extras_folder,
+        plex_enabled=plex_enabled,
+        save_file=writer.save,
+        update_plex=plex_updates.add,
+        known_types=get_known_types(),
+    )
 
     # Initialize database if in monitor mode
     if mode == "monitor" and not os.path.exists(PROCESS_DB):
@@ -424,164 +521,65 @@ def create_symlinks(
     if single_path:
         src_dirs = [single_path]
 
+    # Normalize the user-supplied paths once; everything found by the walk
+    # below is built from these and needs no further normalizing
+    src_dirs = [os.path.normpath(src_dir) for src_dir in src_dirs]
+
     # Load the record of processed files
     processed_files_log = load_processed_files()
 
     # Initialize counters for progress tracking
+    # Files handed to the pool and files that produced a symlink are counted
+    # separately, since results are handled while files are still submitted
     total_files = 0
+    submitted_files = 0
     processed_files = 0
 
-    # First pass to count total files for progress tracking
-    if auto_select:
-        for src_dir in src_dirs:
-            if os.path.isfile(src_dir):
-                total_files += 1
-            else:
-                for root, _, files in os.walk(src_dir):
-                    total_files += len([f for f in files if get_known_types(f)])
+    # Scan every source once, one source per thread. The same listing is
+    # used for the progress total and for submitting the files below.
+    media_files = []
+    if src_dirs:
+        with ThreadPoolExecutor(max_workers=min(8, len(src_dirs))) as executor:
+            media_files = list(executor.map(collect_media_files, src_dirs))
+        total_files = sum(
+            len(files) for groups in media_files for _, files in groups
+        )
+
+    # Build the destination index once for all sources; process_file adds
+    # each symlink it creates. Monitor mode keeps the index in its database
+    # and only walks the destination when that is still empty.
+    if mode == "monitor":
+        dest_index = get_dest_index_from_db()
+        if not dest_index:
+            dest_index = build_dest_index(dest_dir)
+            save_dest_index(dest_index)
+    else:
+        dest_index = build_dest_index(dest_dir)
 
     log_message(f"Starting to process {total_files} files...", level="INFO")
     if console_log:
         console_log(f"Starting to process {total_files} files...")
 
-    if auto_select:
-        # Use thread pool for parallel processing when auto-select is enabled
-        tasks = []
-        with ThreadPoolExecutor(max_workers=cpu_count()) as executor:
-            for src_dir in src_dirs:
-                if os.path.isfile(src_dir):
-                    src_file = src_dir
-                    root = os.path.dirname(src_file)
-                    file = os.path.basename(src_file)
-                    actual_dir = os.path.basename(root)
-
-                    # Get appropriate destination index based on mode
-                    dest_index = (
-                        get_dest_index_from_db()
-                        if mode == "monitor"
-                        else build_dest_index(dest_dir)
-                    )
-
-                    args = (
-                        src_file,
-                        root,
-                        file,
-                        dest_dir,
-                        actual_dir,
-                        tmdb_folder_id_enabled,
-                        rename_enabled,
-                        auto_select,
-                        dest_index,
-                        tmdb_id,
-                        imdb_id,
-                        tvdb_id,
-                        force_show,
-                        force_movie,
-                        season_number,
-                        episode_number,
-                        force_extra,
-                    )
-                    tasks.append(
-                        executor.submit(
-                            process_file, args, processed_files_log, force, console_log
-                        )
-                    )
-                else:
-                    # Handle directory
-                    base_src_dir = os.path.normpath(src_dir)
-                    if console_log:
-                        console_log(f"Scanning source directory: {base_src_dir}")
-                    else:
-                        log_message(
-                            f"Scanning source directory: {base_src_dir}", level="INFO"
-                        )
-
-                    # Get appropriate destination index based on mode
-                    dest_index = (
-                        get_dest_index_from_db()
-                        if mode == "monitor"
-                        else build_dest_index(dest_dir)
-                    )
-
-                    for root, _, files in os.walk(base_src_dir):
-                        # Calculate the relative path from the source directory
-                        rel_path = os.path.relpath(root, base_src_dir)
-                        if rel_path == ".":
-                            actual_dir = os.path.basename(base_src_dir)
-                        else:
-                            actual_dir = os.path.join(
-                                os.path.basename(base_src_dir), rel_path
-                            )
-
-                        for file in files:
-                            if error_event.is_set():
-                                if console_log:
-                                    console_log(
-                                        "Stopping further processing due to an earlier error."
-                                    )
-                                else:
-                                    log_message(
-                                        "Stopping further processing due to an earlier error.",
-                                        level="WARNING",
-                                    )
-                                return
-
-                            src_file = os.path.join(root, file)
-
-                            if (
-                                mode == "create"
-                                and src_file in processed_files_log
-                                and not force
-                            ):
-                                if console_log:
-                                    console_log(
-                                        f"Skipping already processed file: {file}"
-                                    )
-                                continue
-
-                            processed_files += 1
-                            if console_log:
-                                progress = (processed_files / total_files) * 100
-                                console_log(
-                                    f"Processing file {processed_files}/{total_files} ({progress:.1f}%): {file}"
-                                )
-                            else:
-                                log_message(
-                                    f"Processing file {processed_files}/{total_files}: {file}",
-                                    level="INFO",
-                                )
-
-                            args = (
-                                src_file,
-                                root,
-                                file,
-                                dest_dir,
-                                actual_dir,
-                                tmdb_folder_id_enabled,
-                                rename_enabled,
-                                auto_select,
-                                dest_index,
-                                tmdb_id,
-                                imdb_id,
-                                tvdb_id,
-                                force_show,
-                                force_movie,
-                                season_number,
-                                episode_number,
-                                force_extra,
-                            )
-                            tasks.append(
-                                executor.submit(
-                                    process_file,
-                                    args,
-                                    processed_files_log,
-                                    force,
-                                    console_log,
-                                )
-                            )
-
-            # Process completed tasks
-            for task in as_completed(tasks):
+    # Leaving the block flushes the queued records and Plex refreshes,
+    # including on early return
+    with writer, plex_updates:
+        # Files go through a thread pool. Only a bounded window of tasks is kept
+        # in flight so that memory stays flat on large libraries and errors
+        # surface while still walking. Without auto-select, TMDB may prompt
+        # for a choice, so a single worker handles one file at a time in order.
+        if auto_select:
+            workers = get_max_workers()
+            max_pending = 4 * workers
+        else:
+            workers = 1
+            max_pending = 1
+        log_message(f"Processing with {workers} worker threads", level="INFO")
+        pending = set()
+
+        def handle_completed(done):
+            """Record finished tasks; return False once processing must stop."""
+            nonlocal processed_files
+            for task in done:
                 if error_event.is_set():
                     error_msg = (
                         "Error detected during task execution. Stopping all tasks."
@@ -590,14 +588,16 @@ def create_symlinks(
                         console_log(error_msg, level="ERROR")
                     else:
                         log_message(error_msg, level="ERROR")
-                    return
+                    return False
 
                 try:
                     result = task.result()
                     if result and isinstance(result, tuple) and len(result) == 3:
                         dest_file, is_symlink, target_path = result
                         if mode == "monitor":
-                            update_single_file_index(dest_file, is_symlink, target_path)
+                            update_single_file_index(
+                                dest_file, is_symlink, target_path
+                            )
 
                         processed_files += 1
                         if console_log:
@@ -610,7 +610,7 @@ def create_symlinks(
                             f"Successfully processed: {os.path.basename(dest_file)}",
                             level="INFO",
                         )
-                        if is_symlink:
+                        if is_symlink and _DEBUG_LOGGING:
                             log_message(
                                 f"Created symlink: {dest_file} -> {target_path}",
                                 level="DEBUG",
@@ -623,42 +623,34 @@ def create_symlinks(
                     else:
                         log_message(error_msg, level="ERROR")
                     error_event.set()
-                    continue
-
-            # Final completion message
-            completion_msg = (
-                f"Processing completed. Successfully processed {processed_files} files."
+            return True
+
+        def submit(args, entry=None):
+            """Queue one file, waiting for a free slot once the window is full."""
+            nonlocal pending
+            pending.add(
+                executor.submit(
+                    run_file,
+                    args,
+                    processed_files_log,
+                    force,
+                    console_log,
+                    entry=entry,
+                )
             )
-            if console_log:
-                console_log(completion_msg, level="SUCCESS")
-            log_message(completion_msg, level="INFO")
-    else:
-        # Process sequentially when auto-select is disabled
-        for src_dir in src_dirs:
-            if error_event.is_set():
-                if console_log:
-                    console_log("Stopping further processing due to an earlier error.")
-                else:
-                    log_message(
-                        "Stopping further processing due to an earlier error.",
-                        level="WARNING",
-                    )
-                return
+            if len(pending) < max_pending:
+                return True
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            return handle_completed(done)
 
-            try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for src_dir, media_dirs in zip(src_dirs, media_files):
                 if os.path.isfile(src_dir):
                     src_file = src_dir
                     root = os.path.dirname(src_file)
                     file = os.path.basename(src_file)
                     actual_dir = os.path.basename(root)
 
-                    # Get appropriate destination index based on mode
-                    dest_index = (
-                        get_dest_index_from_db()
-                        if mode == "monitor"
-                        else build_dest_index(dest_dir)
-                    )
-
                     args = (
                         src_file,
                         root,
@@ -678,40 +670,29 @@ def create_symlinks(
                         episode_number,
                         force_extra,
                     )
-                    result = process_file(args, processed_files_log, force, console_log)
-
-                    if result and isinstance(result, tuple) and len(result) == 3:
-                        dest_file, is_symlink, target_path = result
-                        if mode == "monitor":
-                            update_single_file_index(dest_file, is_symlink, target_path)
+                    if not submit(args):
+                        return
                 else:
                     # Handle directory
-                    base_src_dir = os.path.normpath(src_dir)
                     if console_log:
-                        console_log(f"Scanning source directory: {base_src_dir}")
+                        console_log(f"Scanning source directory: {src_dir}")
                     else:
                         log_message(
-                            f"Scanning source directory: {base_src_dir}", level="INFO"
+                            f"Scanning source directory: {src_dir}", level="INFO"
                         )
 
-                    # Get appropriate destination index based on mode
-                    dest_index = (
-                        get_dest_index_from_db()
-                        if mode == "monitor"
-                        else build_dest_index(dest_dir)
-                    )
-
-                    for root, _, files in os.walk(base_src_dir):
+                    for root, entries in media_dirs:
                         # Calculate the relative path from the source directory
-                        rel_path = os.path.relpath(root, base_src_dir)
+                        rel_path = os.path.relpath(root, src_dir)
                         if rel_path == ".":
-                            actual_dir = os.path.basename(base_src_dir)
+                            actual_dir = os.path.basename(src_dir)
                         else:
                             actual_dir = os.path.join(
-                                os.path.basename(base_src_dir), rel_path
+                                os.path.basename(src_dir), rel_path
                             )
 
-                        for file in files:
+                        for entry in entries:
+                            file = entry.name
                             if error_event.is_set():
                                 if console_log:
                                     console_log(
@@ -724,15 +705,31 @@ def create_symlinks(
                                     )
                                 return
 
-                            src_file = os.path.join(root, file)
+                            src_file = entry.path
 
                             if (
                                 mode == "create"
                                 and src_file in processed_files_log
                                 and not force
                             ):
+                                if console_log:
+                                    console_log(
+                                        f"Skipping already processed file: {file}"
+                                    )
                                 continue
 
+                            submitted_files += 1
+                            if console_log:
+                                progress = (submitted_files / total_files) * 100
+                                console_log(
+                                    f"Processing file {submitted_files}/{total_files} ({progress:.1f}%): {file}"
+                                )
+                            else:
+                                log_message(
+                                    f"Processing file {submitted_files}/{total_files}: {file}",
+                                    level="INFO",
+                                )
+
                             args = (
                                 src_file,
                                 root,
@@ -752,24 +749,17 @@ def create_symlinks(
                                 episode_number,
                                 force_extra,
                             )
-                            result = process_file(
-                                args, processed_files_log, force, console_log
-                            )
+                            if not submit(args, entry):
+                                return
 
-                            if (
-                                result
-                                and isinstance(result, tuple)
-                                and len(result) == 3
-                            ):
-                                dest_file, is_symlink, target_path = result
-                                if mode == "monitor":
-                                    update_single_file_index(
-                                        dest_file, is_symlink, target_path
-                                    )
-            except Exception as e:
-                if console_log:
-                    console_log(f"Error processing directory {src_dir}: {str(e)}")
-                else:
-                    log_message(
-                        f"Error processing directory {src_dir}: {str(e)}", level="ERROR"
-                    )
+            # Drain whatever is still in flight
+            if not handle_completed(as_completed(pending)):
+                return
+
+            # Final completion message
+            completion_msg = (
+                f"Processing completed. Successfully processed {processed_files} files."
+            )
+            if console_log:
+                console_log(completion_msg, level="SUCCESS")
+            log_message(completion_msg, level="INFO")
@@ -0,0 +1,73 @@
+import time
+import queue
+import threading
+from abc import ABC, abstractmethod
+from MediaHub.utils.logging_utils import log_message
+
+class BatchQueue(ABC):
+    """
+    Collect items from any thread and hand them to one background thread in
+    batches. A batch is handled once it holds batch_size items, or flush_interval
+    seconds after its first item arrived, whichever comes first. The thread starts
+    on the first put(); close() handles whatever is still queued and stops it.
+    Subclasses implement handle_batch(batch).
+    """
+    def __init__(self, flush_interval, batch_size=None, name=None):
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.name = name or type(self).__name__
+        self.pending = queue.Queue()
+        self.thread = None
+        self.lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+
+    def put(self, item):
+        with self.lock:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self.thread.start()
+        self.pending.put(item)
+
+    def close(self):
+        """Handle everything queued so far and stop the background thread."""
+        with self.lock:
+            thread, self.thread = self.thread, None
+        if thread is not None:
+            self.pending.put(None)
+            thread.join()
+
+    @abstractmethod
+    def handle_batch(self, batch):
+        """Process one batch of items on the background thread."""
+
+    def _run(self):
+        while True:
+            item = self.pending.get()
+            if item is None:
+                return
+            batch = [item]
+            stop = False
+            deadline = time.monotonic() + self.flush_interval
+            while self.batch_size is None or len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self.pending.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            try:
+                self.handle_batch(batch)
+            except Exception as e:
+                log_message(f"{self.name} failed to handle {len(batch)} items: {e}", level="ERROR")
+            if stop:
+                return
@@ -206,10 +206,23 @@ def check_existing_variations(name, year, dest_dir):
     return None
 
 def build_dest_index(dest_dir):
-    dest_index = set()
-    for root, dirs, files in os.walk(dest_dir):
-        for name in dirs + files:
-            dest_index.add(os.path.join(root, name))
+    """Map the target of every symlink under dest_dir to the symlink path."""
+    dest_index = {}
+    stack = [dest_dir]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_symlink():
+                        try:
+                            target = os.readlink(entry.path)
+                        except OSError:
+                            continue
+                        dest_index[os.path.normpath(target)] = entry.path
+                    elif entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        except OSError:
+            continue
     return dest_index
 
 def standardize_title(title, check_word_count=True):
@@ -289,19 +302,28 @@ def get_anime_patterns(keywords_file='keywords.json'):
     combined_pattern = '|'.join(f'(?:{pattern})' for pattern in anime_patterns)
     return re.compile(combined_pattern, re.IGNORECASE)
 
-def is_junk_file(file, file_path):
+def is_junk_file(file, file_path, entry=None):
      """
      Determine if the file is an junk based on size.
      Skip .srt & .strm files regardless of size.
+     When the os.DirEntry from a directory scan is given, its cached type and
+     stat are used instead of looking the path up again.
      """
-     if os.path.islink(file_path):
+     if entry is not None:
+         if entry.is_symlink():
+             return False
+     elif os.path.islink(file_path):
          return False
 
      # Ignore .srt and .strm files completely
      if file.lower().endswith(('.srt', '.strm')):
          return False
 
-     file_size_mb = os.path.getsize(file_path) / (1024 * 1024)
+     if entry is not None:
+         file_size = entry.stat().st_size
+     else:
+         file_size = os.path.getsize(file_path)
+     file_size_mb = file_size / (1024 * 1024)
 
      junk_max_size_mb = get_junk_max_size_mb()
 
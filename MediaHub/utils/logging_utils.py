@@ -2,6 +2,7 @@ from datetime import datetime
 import sys
 import os
 import platform
+import threading
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -34,6 +35,10 @@ for file in os.listdir(LOG_DIR):
     if file.endswith('.log') and file != os.path.basename(LOG_FILE):
         os.remove(os.path.join(LOG_DIR, file))
 
+# Log file handle shared by all threads, opened on first use
+_log_file = None
+_log_file_lock = threading.Lock()
+
 # Check if running on Windows
 IS_WINDOWS = platform.system().lower() == 'windows'
 
@@ -81,6 +86,13 @@ def get_color(message):
         return COLOR_CODES["GREEN"]
     return COLOR_CODES["DEFAULT"]
 
+def is_log_level_enabled(level):
+    """
+    Return True if messages at this level are written. Lets hot paths skip
+    building DEBUG messages that log_message would discard anyway.
+    """
+    return LOG_LEVELS.get(level, 20) >= LOG_LEVEL
+
 def log_message(message, level="INFO", output="stdout"):
     """
     Logs messages to the console and optionally to a log file.
@@ -100,9 +112,13 @@ def log_message(message, level="INFO", output="stdout"):
             sys.stderr.write(colored_message)
             sys.stderr.flush()
 
-        # Always write to the log file without color codes
-        with open(LOG_FILE, 'a') as log_file:
-            log_file.write(log_entry)
+        # Always write to the log file without color codes. The file stays open
+        # and is line buffered, so each entry still reaches disk straight away.
+        global _log_file
+        with _log_file_lock:
+            if _log_file is None:
+                _log_file = open(LOG_FILE, 'a', buffering=1)
+            _log_file.write(log_entry)
 
 def log_unsupported_file_type(file_type):
     """
@@ -1,6 +1,5 @@
 import os
 import time
-import logging
 import requests
 import xml.etree.ElementTree as ET
 from concurrent.futures import ThreadPoolExecutor
@@ -9,11 +8,15 @@ from dotenv import load_dotenv
 from urllib.parse import quote
 from logging.handlers import RotatingFileHandler
 from MediaHub.utils.logging_utils import log_message
+from MediaHub.utils.batch_utils import BatchQueue
 from MediaHub.config.config import *
 
 # Load environment variables
 load_dotenv()
 
+# How long PlexUpdateQueue gathers new symlinks before refreshing their folders
+PLEX_UPDATE_DEBOUNCE = 2.0
+
 def get_plex_library_sections() -> List[dict]:
     """Fetch Plex library sections."""
     try:
@@ -37,38 +40,36 @@ def refresh_section(section_id: str, path: str, headers: dict) -> bool:
         log_message(f"Refresh failed: {e}", "DEBUG")
         return False
 
-def refresh_plex_for_file(file_path: str) -> None:
-    """Refresh Plex library for a specific file."""
-    if not plex_update() or not plex_token():
-        return
-
+def refresh_plex_for_directories(directories) -> None:
+    """Refresh each directory once in every movie and show section."""
     headers = {'X-Plex-Token': plex_token()}
     sections = get_plex_library_sections()
     relevant_sections = [s for s in sections if s['type'] in ['movie', 'show']]
 
-    file_dir = os.path.dirname(file_path)
-    tasks = []
-
     with ThreadPoolExecutor() as executor:
-        for section in relevant_sections:
-            tasks.append(executor.submit(refresh_section, section['key'], file_path, headers))
-            tasks.append(executor.submit(refresh_section, section['key'], file_dir, headers))
+        for directory in directories:
+            tasks = [executor.submit(refresh_section, section['key'], directory, headers)
+                     for section in relevant_sections]
+            if any(task.result() for task in tasks):
+                log_message(f"Plex refresh successful for: {directory}", "INFO")
+            else:
+                log_message(f"Failed to refresh Plex for: {directory}", "WARNING")
 
-    results = [task.result() for task in tasks]
-    if any(results):
-        log_message(f"Plex refresh successful for: {file_path}", "INFO")
-    else:
-        log_message(f"Failed to refresh Plex for: {file_path}", "WARNING")
+class PlexUpdateQueue(BatchQueue):
+    """
+    Collect new symlinks from worker threads and refresh Plex from one background
+    thread. Symlinks arriving within PLEX_UPDATE_DEBOUNCE seconds of each other
+    are grouped, and each folder is refreshed once per group instead of once per
+    file.
+    """
+    def __init__(self, debounce=PLEX_UPDATE_DEBOUNCE):
+        super().__init__(debounce)
 
-def update_plex_after_symlink(dest_file: str) -> None:
-    """Wrapper function to trigger Plex refresh after symlink creation."""
-    try:
-        if not logging.getLogger().handlers:
-            setup_logging()
+    def add(self, dest_file: str) -> None:
+        self.put(dest_file)
 
-        if os.path.exists(dest_file):
-            refresh_plex_for_file(dest_file)
-        else:
-            log_message(f"File does not exist: {dest_file}", "ERROR")
-    except Exception as e:
-        log_message(f"Error updating Plex: {e}", "ERROR")
+    def handle_batch(self, batch):
+        try:
+            refresh_plex_for_directories(sorted({os.path.dirname(path) for path in batch}))
+        except Exception as e:
+            log_message(f"Error updating Plex: {e}", "ERROR")